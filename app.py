@@ -17,6 +17,7 @@ app.template_folder = './templates'
 app.config.from_mapping(
     ENV='development' if appengine_info.DEBUG else 'PRODUCTION',
     CACHE_TYPE='SimpleCache',
+    TEMPLATES_AUTO_RELOAD=appengine_info.DEBUG,
     SECRET_KEY=util.read('flask_secret_key'),
 )
 app.json.compact = False
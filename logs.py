@@ -1,5 +1,6 @@
 """Render recent responses and logs."""
-import calendar
+import datetime
+import functools
 import urllib.parse
 
 from flask import render_template
@@ -8,21 +9,39 @@ from oauth_dropins.webutil import flask_util, logs, util
 from app import app, cache
 from models import Response
 
+CACHE_TIME = datetime.timedelta(seconds=15)
+
+# the same actors and posts often show up in multiple recent responses
+pretty_link = functools.lru_cache(maxsize=1024)(util.pretty_link)
+app.add_template_filter(pretty_link, 'pretty_link')
+
+
+@app.template_filter()
+def log_url_path(resp):
+    """Returns the /log path for a Response."""
+    # updated is naive UTC
+    start_time = int(resp.updated.replace(tzinfo=datetime.timezone.utc).timestamp())
+    return (f'/log?key={urllib.parse.quote_plus(resp.key.id())}'
+            f'&start_time={start_time}')
+
 
 @app.get('/responses')
+@flask_util.cached(cache, CACHE_TIME)
 def responses():
     """Renders recent Responses, with links to logs."""
-    responses = Response.query()\
-        .filter(Response.status.IN(('new', 'complete', 'error')))\
-        .order(-Response.updated).fetch(20)
-
-    for r in responses:
-        r.source_link = util.pretty_link(r.source())
-        r.target_link = util.pretty_link(r.target())
-        r.log_url_path = '/log?' + urllib.parse.urlencode({
-          'key': r.key.id(),
-          'start_time': calendar.timegm(r.updated.timetuple()),
-        })
+    # projection queries so we don't load the stored source and target data.
+    # datastore won't project a property we filter on, so run one query per
+    # status and keep track of which one each response came from.
+    futures = {}
+    for status in ('new', 'complete', 'error'):
+        futures[status] = Response.query(Response.status == status)\
+            .order(-Response.updated)\
+            .fetch_async(20, projection=[Response.protocol, Response.updated])
+
+    responses = [(status, r) for status, future in futures.items()
+                 for r in future.result()]
+    responses.sort(key=lambda status_r: status_r[1].updated, reverse=True)
+    responses = responses[:20]
 
     return render_template('responses.html', responses=responses)
 
@@ -0,0 +1,46 @@
+"""Unit tests for logs.py."""
+import calendar
+
+from oauth_dropins.webutil import util
+
+from models import Response
+from . import testutil
+
+
+class ResponsesTest(testutil.TestCase):
+
+    def test_responses(self):
+        # interleave statuses so that ordering has to merge across them
+        statuses = ('new', 'ignored', 'complete', 'error')
+        stored = []
+        for i in range(30):
+            resp = Response(source=f'http://a/reply/{i}', target='http://orig/post',
+                            status=statuses[i % 4], protocol='activitypub')
+            resp.put()
+            stored.append(resp)
+
+        # newest is ignored, so the top row is the one before it
+        newest = stored[-2]
+        self.assertEqual('ignored', stored[-1].status)
+        self.assertEqual('new', newest.status)
+        start_time = calendar.timegm(newest.updated.timetuple())
+
+        got = self.client.get('/responses')
+        self.assertEqual(200, got.status_code)
+        html = got.get_data(as_text=True)
+
+        self.assertIn(
+            '<a href="/log?key=http%3A%2F%2Fa%2Freply%2F28+http%3A%2F%2Forig%2Fpost'
+            f'&amp;start_time={start_time}">', html)
+
+        # first two chunks are before the table and the header row
+        rows = html.split('<tr>')[2:]
+        expected = [r for r in reversed(stored) if r.status != 'ignored'][:20]
+        self.assertEqual(20, len(rows))
+
+        for resp, row in zip(expected, rows):
+            self.assertIn(util.pretty_link(resp.source()), row)
+            self.assertIn(util.pretty_link(resp.target()), row)
+            self.assertIn(f'<td>{resp.status}</td>', row)
+
+        self.assertNotIn('<td>ignored</td>', html)